@@ -1,12 +1,12 @@
 """A simple ToDo server implemented with the Model Context Protocol (MCP).
 
 This module defines a FastMCP server that exposes a set of resources and tools
-for managing a JSON‑backed task list. It demonstrates how to use the
+for managing a SQLite‑backed task list. It demonstrates how to use the
 ``mcp`` Python SDK to build a custom server, how to organise code for
 structured outputs via Pydantic models and how to persist state in an
-external file. The server exposes the following features:
+external database. The server exposes the following features:
 
-* A resource for listing all tasks stored in a JSON file.
+* A resource for listing all stored tasks.
 * Tools to add new tasks, explain an existing task, decompose a task
   into subtasks, prioritise tasks using the Eisenhower principle and
   recommend which tasks to tackle next.
@@ -27,25 +27,51 @@ provide authentication via environment variables.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import json
 import os
+import re
+import sqlite3
+import threading
+import time
 from datetime import date, datetime
 from typing import List
 
 #from mcp.server.fastmcp import Context, FastMCP
+import msgspec
 from fastmcp import FastMCP, Context
-from pydantic import BaseModel, Field
+from fastmcp.server.dependencies import get_http_headers
+
+# orjson serialises roughly an order of magnitude faster than the stdlib and
+# handles ``date``/``datetime`` natively. It is used for the subtasks column
+# and the JSON export; fall back to the stdlib ``json`` module if orjson is
+# not installed so the server keeps working in minimal environments.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ###############################################################################
 # Configuration
 #
-# The location of the JSON file used to persist tasks can be configured via
-# the ``TODO_JSON_PATH`` environment variable. When running in a container
-# it's common to mount a volume under ``/data`` and set this variable to
-# ``/data/todos.json`` to persist data outside the container.
+# Tasks are persisted in a single-file SQLite database (WAL mode). Lookups
+# and single-task updates are indexed O(log N) operations and the sort /
+# filter logic of the read tools is pushed into SQL, so no tool call ever
+# re-parses the whole data set. The database location can be configured via
+# the ``TODO_DB_PATH`` environment variable; in a container it's common to
+# mount a volume under ``/data`` and point it at ``/data/todos.db``.
+#
+# The previous JSON Lines files (``TODO_JSON_PATH``, default
+# ``./todos.jsonl``, plus ``todo_archive.jsonl``) are imported into the
+# database once at startup, see ``_migrate_legacy_files``.
 ###############################################################################
 
-DATA_PATH = os.getenv("TODO_JSON_PATH", "./todos.json")
+DATA_PATH = os.getenv("TODO_JSON_PATH", "./todos.jsonl")
+# Derived paths computed once instead of on every read/write call.
+DATA_DIR = os.path.dirname(DATA_PATH) or "."
+ARCHIVE_PATH = os.path.join(os.path.dirname(DATA_PATH), "todo_archive.jsonl")
+DB_PATH = os.getenv("TODO_DB_PATH", os.path.join(DATA_DIR, "todos.db"))
 SERVER_PORT = os.getenv("SERVER_PORT", 3000)
 
 
@@ -55,81 +81,222 @@ SERVER_PORT = os.getenv("SERVER_PORT", 3000)
 # The ``Task`` model defines the structure of each todo entry. Using a
 # Pydantic model here allows MCP to automatically generate schemas for
 # structured responses which makes it easier for LLMs to consume the data.
+# It lives in ``models.py`` so it can optionally be compiled with mypyc
+# (``python setup.py build_ext --inplace``) for faster per-row instantiation
+# in the read tools.
 ###############################################################################
 
-class Task(BaseModel):
-    """Representation of a single todo item.
-
-    Attributes:
-        id: A unique identifier for the task. In a production system you
-            might use UUIDs; here we stick with integers for simplicity.
-        title: A short title describing the task.
-        description: A more detailed description of the task.
-        due: The date by which the task should be completed.
-        important: Whether the task is important (Eisenhower matrix).
-        urgent: Whether the task is urgent (Eisenhower matrix).
-        subtasks: A list of strings representing decomposed steps. This
-            field is optional – it may be empty if the task has not been
-            decomposed yet.
-        completed: Flag indicating whether the task has been completed.
-    """
-
-    id: int = Field(..., description="Unique identifier for the task")
-    title: str = Field(..., description="Short title for the task")
-    description: str = Field(..., description="Detailed description of the task")
-    due: date = Field(..., description="Due date in YYYY‑MM‑DD format")
-    important: bool = Field(..., description="True if the task is important")
-    urgent: bool = Field(..., description="True if the task is urgent")
-    subtasks: List[str] = Field(default_factory=list, description="List of subtasks")
-    completed: bool = Field(default=False, description="Whether the task is completed")
+from models import Task, TaskList, TaskRow
 
-
-# After defining the Task model, ensure Pydantic resolves all forward references
-# such as the ``date`` annotation. Without this call certain environments
-# (including test harnesses) may raise a ``PydanticUserError`` complaining that
-# the model is not fully defined. Calling ``model_rebuild`` resolves the
-# annotations in place and avoids runtime errors when instantiating the model.
-Task.model_rebuild()
+# Reusable decoder for one legacy JSON Lines task row; only needed when
+# importing pre-database files at startup.
+_task_decoder = msgspec.json.Decoder(TaskRow)
 
 
 ###############################################################################
-# Utility functions
+# Storage
 #
-# A pair of helpers for loading and saving tasks to the JSON file. These
-# routines centralise all file I/O to simplify error handling and ensure
-# consistent data representation.
+# A single shared connection in WAL mode. WAL lets readers proceed while a
+# write is in flight and turns each row-level update into a small append to
+# the write-ahead log instead of a full-file rewrite. Access is serialised
+# through a lock because FastMCP may run sync tool handlers on worker
+# threads.
 ###############################################################################
 
-def _load_tasks() -> List[dict]:
-    """Load tasks from the JSON file.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks(
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    due TEXT NOT NULL,
+    important INTEGER NOT NULL,
+    urgent INTEGER NOT NULL,
+    subtasks TEXT NOT NULL DEFAULT '[]',
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS archive(
+    id INTEGER,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    due TEXT NOT NULL,
+    important INTEGER NOT NULL,
+    urgent INTEGER NOT NULL,
+    subtasks TEXT NOT NULL DEFAULT '[]',
+    completed INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS meta(
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
 
-    Returns:
-        A list of dictionaries representing tasks. If the file does not
-        exist or is empty an empty list is returned.
+# The Eisenhower ordering used by prioritise_tasks / recommend_tasks_for_today.
+# ISO due dates compare correctly as text, so the whole sort runs inside
+# SQLite's C sorter.
+_PRIORITY_ORDER = "ORDER BY important DESC, urgent DESC, due ASC"
+
+_db_lock = threading.Lock()
+
+# Monotonic data-version counters, bumped on every mutation. They key the
+# response etags and the memoised views; seeding from the clock keeps etags
+# from colliding across server restarts.
+_generation = time.time_ns()
+_archive_generation = time.time_ns()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open (and if necessary initialise) the task database."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    conn.commit()
+    return conn
+
+
+def _dumps_subtasks(subtasks: List[str]) -> str:
+    """Encode the subtasks list for the TEXT column."""
+    if orjson is not None:
+        return orjson.dumps(subtasks).decode("utf-8")
+    return json.dumps(subtasks)
+
+
+def _record_to_row(t: dict) -> tuple:
+    """Flatten a task record dict into the tasks/archive column tuple."""
+    due = t.get("due")
+    return (
+        t.get("id"),
+        t.get("title", ""),
+        t.get("description", ""),
+        due.isoformat() if isinstance(due, date) else str(due),
+        1 if t.get("important") else 0,
+        1 if t.get("urgent") else 0,
+        _dumps_subtasks(t.get("subtasks") or []),
+        1 if t.get("completed") else 0,
+    )
+
+
+def _row_to_record(row: sqlite3.Row) -> dict:
+    """Convert a database row back into a plain task record dict."""
+    subtasks = row["subtasks"]
+    return {
+        "id": row["id"],
+        "title": row["title"],
+        "description": row["description"],
+        "due": row["due"],
+        "important": bool(row["important"]),
+        "urgent": bool(row["urgent"]),
+        "subtasks": (orjson.loads(subtasks) if orjson is not None
+                     else json.loads(subtasks)),
+        "completed": bool(row["completed"]),
+    }
+
+
+def _read_legacy_file(path: str) -> List[dict]:
+    """Read a pre-database task file (JSON Lines or a legacy JSON array).
+
+    If the configured path is missing, fall back to its ``.json`` sibling —
+    a deployment upgrading straight from the original layout has only
+    ``todos.json`` / ``todo_archive.json`` on disk.
     """
-    if not os.path.exists(DATA_PATH):
-        return []
+    if not os.path.exists(path):
+        legacy = os.path.splitext(path)[0] + ".json"
+        if legacy == path or not os.path.exists(legacy):
+            return []
+        path = legacy
     try:
-        with open(DATA_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Ensure we always return a list of dicts
-        if isinstance(data, list):
-            return data
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         return []
-    except (json.JSONDecodeError, FileNotFoundError):
+    if not raw.strip():
         return []
+    if raw.lstrip().startswith(b"["):
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return data if isinstance(data, list) else []
+    return [
+        msgspec.structs.asdict(_task_decoder.decode(line))
+        for line in raw.splitlines()
+        if line.strip()
+    ]
+
+
+def _migrate_legacy_files(conn: sqlite3.Connection) -> None:
+    """One-shot import of the old JSON/JSON Lines files into the database.
+
+    Runs exactly once per database (recorded in the ``meta`` table); the
+    legacy files are left in place so a rollback to an older server version
+    loses nothing.
+    """
+    done = conn.execute(
+        "SELECT value FROM meta WHERE key = 'files_imported'"
+    ).fetchone()
+    if done is not None:
+        return
+    tasks = _read_legacy_file(DATA_PATH)
+    archived = _read_legacy_file(ARCHIVE_PATH)
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [_record_to_row(t) for t in tasks],
+        )
+        conn.executemany(
+            "INSERT INTO archive VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [_record_to_row(t) for t in archived],
+        )
+        conn.execute("INSERT INTO meta VALUES ('files_imported', '1')")
 
 
-def _save_tasks(tasks: List[dict]) -> None:
-    """Persist the list of tasks to disk.
+def _as_task(t: dict) -> Task:
+    """Build a ``Task`` from a stored record without re-validating it.
 
-    Args:
-        tasks: List of task dictionaries to write.
+    Records read back from the database were validated when they were
+    written, so the read-only tools use ``model_construct`` to skip the
+    full pydantic validation pass. ``model_construct`` performs no coercion,
+    so the ``due`` string stored in the TEXT column is converted to a
+    ``date`` first. Untrusted input in ``add_task`` still goes through
+    normal validation.
+    """
+    due = t.get("due")
+    if isinstance(due, str):
+        t = {**t, "due": date.fromisoformat(due)}
+    return Task.model_construct(**t)
+
+
+@functools.lru_cache(maxsize=8)
+def _sorted_view(generation: int) -> tuple[Task, ...]:
+    """Priority-ordered ``Task`` view, memoised per data generation.
+
+    ``prioritise_tasks`` and ``recommend_tasks_for_today`` derive their
+    output from the same ordered query; back-to-back calls between writes
+    are common with polling LLM clients, so the query and Task construction
+    run once per data version. The generation counter bumps on every
+    mutation, which makes each new version a fresh cache key; stale
+    generations fall out of the LRU automatically.
     """
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(DATA_PATH) or ".", exist_ok=True)
-    with open(DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(tasks, f, indent=2, default=str)
+    with _db_lock:
+        rows = _conn.execute(f"SELECT * FROM tasks {_PRIORITY_ORDER}").fetchall()
+    return tuple(_as_task(_row_to_record(r)) for r in rows)
+
+
+# Sentence boundary for ``decompose_task``: split after ./!/? followed by
+# whitespace, so decimals, abbreviations and URLs inside a sentence stay
+# intact (unlike the old ``str.split(".")``). Compiled once at import.
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+_conn = _connect()
+_migrate_legacy_files(_conn)
+atexit.register(_conn.close)
+
+# Fully built ``Task`` response list for ``list_tasks``, keyed on the data
+# generation. FastMCP serialises the returned models itself, so caching the
+# constructed list is as far up the response path as we can memoise — repeat
+# reads of unchanged data skip the query and Task construction entirely.
+_tasks_view: List[Task] | None = None
+_tasks_view_gen: int | None = None
 
 
 ###############################################################################
@@ -157,7 +324,7 @@ mcp = FastMCP(name="Todo Server")
 # @mcp.resource("todos://list")
 # def list_tasks() -> List[Task]:
 #     """Return the current list of tasks.
-# 
+#
 #     This resource loads the raw JSON data and converts each entry into a
 #     ``Task`` model. MCP will automatically serialise the list of Pydantic
 #     objects into a structured response for the LLM client.
@@ -171,15 +338,32 @@ mcp = FastMCP(name="Todo Server")
 # more widely available, ensuring full compatibility with clients like
 # Claude Code.
 @mcp.tool()
-def list_tasks() -> List[Task]:
+def list_tasks() -> TaskList:
     """Return the current list of tasks.
 
-    This tool loads the raw JSON data and converts each entry into a
+    This tool reads all rows from the database and converts each into a
     ``Task`` model. MCP will automatically serialise the list of Pydantic
-    objects into a structured response for the LLM client.
+    objects into a structured response for the LLM client. The built list
+    is memoised per data generation, so polling clients hitting an
+    unchanged task list don't pay for the query or Task construction again.
+
+    The response carries an ``etag`` derived from the data generation. Over
+    the HTTP transport, clients that send it back as ``If-None-Match`` get
+    a ``not_modified`` response with no task payload when nothing changed —
+    the MCP equivalent of a 304.
     """
-    raw = _load_tasks()
-    return [Task(**t) for t in raw]
+    global _tasks_view, _tasks_view_gen
+    etag = hex(_generation)
+    if get_http_headers().get("if-none-match") == etag:
+        return TaskList(etag=etag, not_modified=True)
+    if _tasks_view is not None and _tasks_view_gen == _generation:
+        return TaskList(etag=etag, tasks=_tasks_view)
+    with _db_lock:
+        rows = _conn.execute("SELECT * FROM tasks ORDER BY rowid").fetchall()
+    view = [_as_task(_row_to_record(r)) for r in rows]
+    _tasks_view = view
+    _tasks_view_gen = _generation
+    return TaskList(etag=etag, tasks=view)
 
 
 ###############################################################################
@@ -223,6 +407,7 @@ def add_task(
     Returns:
         The created ``Task`` instance.
     """
+    global _generation
     # Default to an empty list if subtasks weren't provided
     if subtasks is None:
         subtasks = []
@@ -237,9 +422,24 @@ def add_task(
         subtasks=subtasks,
         completed=completed,
     )
-    tasks = _load_tasks()
-    tasks.append(new_task.model_dump())
-    _save_tasks(tasks)
+    # INSERT OR REPLACE keeps the previous last-writer-wins behaviour for
+    # duplicate ids. A single-row insert touches only the WAL, not the
+    # existing data pages.
+    with _db_lock, _conn:
+        _conn.execute(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                new_task.id,
+                new_task.title,
+                new_task.description,
+                new_task.due.isoformat(),
+                1 if new_task.important else 0,
+                1 if new_task.urgent else 0,
+                _dumps_subtasks(new_task.subtasks),
+                1 if new_task.completed else 0,
+            ),
+        )
+        _generation += 1
     return new_task
 
 
@@ -259,17 +459,19 @@ def explain_task(task_id: int) -> str:
     Returns:
         A string explaining the task or a message if the task doesn't exist.
     """
-    tasks = _load_tasks()
-    task = next((t for t in tasks if t.get("id") == task_id), None)
-    if task is None:
+    # Indexed primary-key lookup instead of scanning all tasks.
+    with _db_lock:
+        row = _conn.execute(
+            "SELECT * FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+    if row is None:
         return f"No task found with id {task_id}."
     # Build a simple explanation using the Eisenhower matrix
-    importance = "important" if task.get("important") else "not important"
-    urgency = "urgent" if task.get("urgent") else "not urgent"
-    due = task.get("due")
+    importance = "important" if row["important"] else "not important"
+    urgency = "urgent" if row["urgent"] else "not urgent"
     return (
-        f"Task '{task.get('title')}' is {importance} and {urgency}. "
-        f"It is due on {due}. Description: {task.get('description')}"
+        f"Task '{row['title']}' is {importance} and {urgency}. "
+        f"It is due on {row['due']}. Description: {row['description']}"
     )
 
 
@@ -288,16 +490,25 @@ def decompose_task(task_id: int) -> List[str]:
     Returns:
         A list of subtasks. Returns an empty list if the task is not found.
     """
-    tasks = _load_tasks()
-    for t in tasks:
-        if t.get("id") == task_id:
-            description = t.get("description", "")
-            # Naive sentence splitting on periods; trim whitespace
-            parts = [s.strip() for s in description.split(".") if s.strip()]
-            t["subtasks"] = parts
-            _save_tasks(tasks)
-            return parts
-    return []
+    global _generation
+    with _db_lock:
+        row = _conn.execute(
+            "SELECT description FROM tasks WHERE id = ?", (task_id,)
+        ).fetchone()
+    if row is None:
+        return []
+    description = row["description"]
+    # Split on sentence boundaries; trim whitespace and trailing punctuation
+    parts = [s.strip().rstrip(".!?") for s in _SENT_RE.split(description)]
+    parts = [s for s in parts if s]
+    # Single-row update: only the changed record is written.
+    with _db_lock, _conn:
+        _conn.execute(
+            "UPDATE tasks SET subtasks = ? WHERE id = ?",
+            (_dumps_subtasks(parts), task_id),
+        )
+        _generation += 1
+    return parts
 
 
 @mcp.tool()
@@ -307,23 +518,14 @@ def prioritise_tasks() -> List[Task]:
     Implements the Eisenhower matrix: important & urgent tasks first,
     followed by important but not urgent, then urgent but not important,
     and finally tasks that are neither. Within each category tasks are
-    sorted by their due date ascending.
+    sorted by their due date ascending. The ordering runs entirely inside
+    SQLite — ISO due dates compare correctly as text — and the resulting
+    view is memoised per data generation (see ``_sorted_view``).
 
     Returns:
         A sorted list of ``Task`` models.
     """
-    raw_tasks = _load_tasks()
-    # Define a key that reflects the Eisenhower priority order. False sorts
-    # before True, so we invert booleans to prioritise True values.
-    def sort_key(t: dict) -> tuple:
-        return (
-            not t.get("important", False),  # important tasks first (False < True)
-            not t.get("urgent", False),     # urgent tasks within same importance
-            t.get("due", date.max)           # earlier due dates first
-        )
-
-    sorted_tasks = sorted(raw_tasks, key=sort_key)
-    return [Task(**t) for t in sorted_tasks]
+    return list(_sorted_view(_generation))
 
 
 @mcp.tool()
@@ -345,20 +547,9 @@ def recommend_tasks_for_today(ctx: Context) -> List[Task]:
         appropriate tasks to tackle today.
     """
     today = date.today()
-    raw_tasks = _load_tasks()
-    # Filter out completed tasks
-    candidates = [t for t in raw_tasks if not t.get("completed", False)]
-    # Sort using the same Eisenhower logic as above
-    def sort_key(t: dict) -> tuple:
-        return (
-            not t.get("important", False),
-            not t.get("urgent", False),
-            t.get("due", date.max)
-        )
-    sorted_candidates = sorted(candidates, key=sort_key)
-    # Return the first five tasks
-    top_tasks = sorted_candidates[:5]
-    return [Task(**t) for t in top_tasks]
+    # Reuse the memoised sorted view and filter/slice it here, so repeated
+    # calls between writes share one query with prioritise_tasks.
+    return [t for t in _sorted_view(_generation) if not t.completed][:5]
 
 
 @mcp.tool()
@@ -366,8 +557,9 @@ def mark_task_completed(task_id: int) -> str:
     """Mark a task as completed.
 
     This helper illustrates how to update a field on a task. The function
-    searches for the task by ID, sets its ``completed`` flag to ``True`` and
-    saves the changes. It returns a confirmation message or an error.
+    updates the ``completed`` flag of the matching row in place — a
+    single-row indexed UPDATE instead of rewriting the whole task list.
+    It returns a confirmation message or an error.
 
     Args:
         task_id: Identifier of the task to mark complete.
@@ -375,75 +567,83 @@ def mark_task_completed(task_id: int) -> str:
     Returns:
         A human‑readable message describing the outcome.
     """
-    tasks = _load_tasks()
-    for t in tasks:
-        if t.get("id") == task_id:
-            t["completed"] = True
-            _save_tasks(tasks)
-            return f"Task {task_id} marked as completed."
-    return f"Task {task_id} not found."
+    global _generation
+    with _db_lock, _conn:
+        cur = _conn.execute(
+            "UPDATE tasks SET completed = 1 WHERE id = ?", (task_id,)
+        )
+        if cur.rowcount == 0:
+            return f"Task {task_id} not found."
+        _generation += 1
+    return f"Task {task_id} marked as completed."
 
 
 @mcp.tool()
 def archive_completed_tasks() -> str:
     """Archive all completed tasks.
 
-    This tool moves all tasks marked as 'completed' from the active
-    todos.json file to a separate todo_archiv.json file. This helps
-    to keep the active task list clean and focused on pending items.
+    This tool moves all tasks marked as 'completed' from the active tasks
+    table to the archive table in a single transaction. This helps to keep
+    the active task list clean and focused on pending items.
 
     Returns:
         A string confirming the number of tasks that were archived.
     """
-    tasks = _load_tasks()
-    completed_tasks = [t for t in tasks if t.get("completed")]
-    incomplete_tasks = [t for t in tasks if not t.get("completed")]
-
-    if not completed_tasks:
-        return "No completed tasks to archive."
-
-    # Save the incomplete tasks back to the main file
-    _save_tasks(incomplete_tasks)
+    global _generation, _archive_generation
+    # DELETE ... RETURNING moves the rows in one statement; feeding the
+    # result straight into the archive INSERT keeps the whole move atomic.
+    with _db_lock, _conn:
+        moved = _conn.execute(
+            "DELETE FROM tasks WHERE completed = 1 RETURNING *"
+        ).fetchall()
+        if not moved:
+            return "No completed tasks to archive."
+        _conn.executemany(
+            "INSERT INTO archive VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [tuple(r) for r in moved],
+        )
+        _generation += 1
+        _archive_generation += 1
+    return f"Archived {len(moved)} completed tasks."
 
-    # Append completed tasks to the archive file
-    archive_path = os.path.join(os.path.dirname(DATA_PATH), "todo_archive.json")
-    archived_tasks = []
-    if os.path.exists(archive_path):
-        with open(archive_path, "r", encoding="utf-8") as f:
-            try:
-                archived_tasks = json.load(f)
-            except json.JSONDecodeError:
-                archived_tasks = []
 
-    archived_tasks.extend(completed_tasks)
+@mcp.tool()
+def view_archived_tasks() -> TaskList:
+    """View all archived tasks.
 
-    with open(archive_path, "w", encoding="utf-8") as f:
-        json.dump(archived_tasks, f, indent=2, default=str)
+    This tool reads the archived tasks from the archive table and returns
+    them as a list. Like ``list_tasks`` the response carries an ``etag``;
+    clients echoing it via ``If-None-Match`` over HTTP receive a
+    ``not_modified`` response instead of the full archive.
 
-    return f"Archived {len(completed_tasks)} completed tasks."
+    Returns:
+        A ``TaskList`` envelope holding the archived tasks.
+    """
+    etag = hex(_archive_generation)
+    if get_http_headers().get("if-none-match") == etag:
+        return TaskList(etag=etag, not_modified=True)
+    with _db_lock:
+        rows = _conn.execute("SELECT * FROM archive ORDER BY rowid").fetchall()
+    return TaskList(etag=etag, tasks=[_as_task(_row_to_record(r)) for r in rows])
 
 
 @mcp.tool()
-def view_archived_tasks() -> List[Task]:
-    """View all archived tasks.
+def export_tasks_json() -> str:
+    """Export the active task list as a JSON array string.
 
-    This tool reads the archived tasks from the `todo_archive.json` file
-    and returns them as a list.
+    Provided for compatibility with consumers of the old file format: the
+    output matches the legacy ``todos.json`` layout (a JSON array of task
+    objects) and can be redirected into a file as a backup.
 
     Returns:
-        A list of ``Task`` models representing the archived tasks.
+        The active tasks serialised as a JSON array.
     """
-    archive_path = os.path.join(os.path.dirname(DATA_PATH), "todo_archive.json")
-    if not os.path.exists(archive_path):
-        return []
-    try:
-        with open(archive_path, "r", encoding="utf-8") as f:
-            archived_tasks = json.load(f)
-        if isinstance(archived_tasks, list):
-            return [Task(**t) for t in archived_tasks]
-        return []
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+    with _db_lock:
+        rows = _conn.execute("SELECT * FROM tasks ORDER BY rowid").fetchall()
+    records = [_row_to_record(r) for r in rows]
+    if orjson is not None:
+        return orjson.dumps(records).decode("utf-8")
+    return json.dumps(records)
 
 
 ###############################################################################
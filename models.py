@@ -0,0 +1,94 @@
+"""Data model for the ToDo MCP server.
+
+The ``Task`` model lives in its own module so it can optionally be compiled
+to a C extension with mypyc (see ``setup.py``). Task objects are created once
+per row on every read tool, so shaving the per-instance Python dispatch
+overhead compounds with the ``model_construct`` fast path used on the read
+paths. The module works identically when imported as plain Python — the
+compiled extension is simply picked up first if it has been built.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import List
+
+import msgspec
+from pydantic import BaseModel, Field
+
+
+class Task(BaseModel):
+    """Representation of a single todo item.
+
+    Attributes:
+        id: A unique identifier for the task. In a production system you
+            might use UUIDs; here we stick with integers for simplicity.
+        title: A short title describing the task.
+        description: A more detailed description of the task.
+        due: The date by which the task should be completed.
+        important: Whether the task is important (Eisenhower matrix).
+        urgent: Whether the task is urgent (Eisenhower matrix).
+        subtasks: A list of strings representing decomposed steps. This
+            field is optional – it may be empty if the task has not been
+            decomposed yet.
+        completed: Flag indicating whether the task has been completed.
+    """
+
+    id: int = Field(..., description="Unique identifier for the task")
+    title: str = Field(..., description="Short title for the task")
+    description: str = Field(..., description="Detailed description of the task")
+    due: date = Field(..., description="Due date in YYYY‑MM‑DD format")
+    important: bool = Field(..., description="True if the task is important")
+    urgent: bool = Field(..., description="True if the task is urgent")
+    subtasks: List[str] = Field(default_factory=list, description="List of subtasks")
+    completed: bool = Field(default=False, description="Whether the task is completed")
+
+
+class TaskList(BaseModel):
+    """Response envelope for task-list reads with HTTP-style cache hints.
+
+    Attributes:
+        etag: Opaque version tag derived from the server's in-process data
+            generation counter, which bumps on every mutation. Clients can
+            echo it back in an ``If-None-Match`` header (over the HTTP
+            transport) to short-circuit unchanged reads.
+        not_modified: True when the client's etag still matched; ``tasks``
+            is then empty and the client should reuse its cached copy.
+        tasks: The task records, empty on a not-modified response.
+    """
+
+    etag: str = Field(..., description="Version tag for the task list")
+    not_modified: bool = Field(
+        default=False,
+        description="True if the supplied If-None-Match etag still matches",
+    )
+    tasks: List[Task] = Field(default_factory=list, description="List of tasks")
+
+
+class TaskRow(msgspec.Struct):
+    """Schema of a task record in the legacy JSON Lines files.
+
+    Mirrors ``Task`` field for field. msgspec decodes and validates a JSON
+    row in a single C-level pass, several times faster than parsing into
+    dicts and validating with pydantic. Only the one-shot import of
+    pre-database files at startup uses this struct; ``Task`` stays the
+    source of truth for MCP schema generation and for validating untrusted
+    input.
+    """
+
+    id: int
+    title: str
+    description: str
+    due: date
+    important: bool
+    urgent: bool
+    subtasks: List[str] = []
+    completed: bool = False
+
+
+# After defining the Task model, ensure Pydantic resolves all forward references
+# such as the ``date`` annotation. Without this call certain environments
+# (including test harnesses) may raise a ``PydanticUserError`` complaining that
+# the model is not fully defined. Calling ``model_rebuild`` resolves the
+# annotations in place and avoids runtime errors when instantiating the model.
+Task.model_rebuild()
@@ -0,0 +1,26 @@
+"""Optional build script: compile the data model with mypyc.
+
+The server runs fine as pure Python; this exists only to squeeze extra
+throughput out of the per-row ``Task`` instantiation in the read tools.
+With mypy/mypyc installed, run
+
+    python setup.py build_ext --inplace
+
+to build ``models`` as a C extension. The import system prefers the
+compiled module automatically; deleting the built artefacts falls back
+to the pure-Python version.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["models.py"])
+except ImportError:
+    # mypyc not installed — build nothing, the pure-Python module is used.
+    ext_modules = []
+
+setup(
+    name="awesome-todo-server",
+    ext_modules=ext_modules,
+)